@@ -56,21 +56,12 @@ class Ted5000Sensor(SensorEntity):
         """Initialize the sensor."""
         units = {POWER_WATT: "power", VOLT: "voltage"}
         self._gateway = gateway
-        self._name = f"{name} mtu{mtu} {units[unit]}"
+        self._attr_name = f"{name} mtu{mtu} {units[unit]}"
+        self._attr_unit_of_measurement = unit
         self._mtu = mtu
         self._unit = unit
         self.update()
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return self._name
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit the value is expressed in."""
-        return self._unit
-
     @property
     def state(self):
         """Return the state of the resources."""
@@ -1,7 +1,9 @@
 """Weather component that handles meteorological data for your location."""
+from __future__ import annotations
+
 from datetime import timedelta
 import logging
-from typing import final
+from typing import Final, TypedDict, final
 
 from homeassistant.const import PRECISION_TENTHS, PRECISION_WHOLE, TEMP_CELSIUS
 from homeassistant.helpers.config_validation import (  # noqa: F401
@@ -32,16 +34,16 @@ ATTR_CONDITION_SNOWY_RAINY = "snowy-rainy"
 ATTR_CONDITION_SUNNY = "sunny"
 ATTR_CONDITION_WINDY = "windy"
 ATTR_CONDITION_WINDY_VARIANT = "windy-variant"
-ATTR_FORECAST = "forecast"
-ATTR_FORECAST_CONDITION = "condition"
-ATTR_FORECAST_PRECIPITATION = "precipitation"
-ATTR_FORECAST_PRECIPITATION_PROBABILITY = "precipitation_probability"
-ATTR_FORECAST_PRESSURE = "pressure"
-ATTR_FORECAST_TEMP = "temperature"
-ATTR_FORECAST_TEMP_LOW = "templow"
-ATTR_FORECAST_TIME = "datetime"
-ATTR_FORECAST_WIND_BEARING = "wind_bearing"
-ATTR_FORECAST_WIND_SPEED = "wind_speed"
+ATTR_FORECAST: Final = "forecast"
+ATTR_FORECAST_CONDITION: Final = "condition"
+ATTR_FORECAST_PRECIPITATION: Final = "precipitation"
+ATTR_FORECAST_PRECIPITATION_PROBABILITY: Final = "precipitation_probability"
+ATTR_FORECAST_PRESSURE: Final = "pressure"
+ATTR_FORECAST_TEMP: Final = "temperature"
+ATTR_FORECAST_TEMP_LOW: Final = "templow"
+ATTR_FORECAST_TIME: Final = "datetime"
+ATTR_FORECAST_WIND_BEARING: Final = "wind_bearing"
+ATTR_FORECAST_WIND_SPEED: Final = "wind_speed"
 ATTR_WEATHER_ATTRIBUTION = "attribution"
 ATTR_WEATHER_HUMIDITY = "humidity"
 ATTR_WEATHER_OZONE = "ozone"
@@ -51,6 +53,8 @@ ATTR_WEATHER_VISIBILITY = "visibility"
 ATTR_WEATHER_WIND_BEARING = "wind_bearing"
 ATTR_WEATHER_WIND_SPEED = "wind_speed"
 
+FORECAST_TEMPERATURE_ATTRS = (ATTR_FORECAST_TEMP, ATTR_FORECAST_TEMP_LOW)
+
 DOMAIN = "weather"
 
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
@@ -77,62 +81,96 @@ async def async_unload_entry(hass, entry):
     return await hass.data[DOMAIN].async_unload_entry(entry)
 
 
+class Forecast(TypedDict, total=False):
+    """Typed weather forecast dict."""
+
+    condition: str | None
+    datetime: str
+    precipitation_probability: int | None
+    precipitation: float | None
+    pressure: float | None
+    temperature: float | None
+    templow: float | None
+    wind_bearing: float | str | None
+    wind_speed: float | None
+
+
 class WeatherEntity(Entity):
     """ABC for weather data."""
 
+    _attr_attribution: str | None = None
+    _attr_condition: str | None
+    _attr_forecast: list[Forecast] | None = None
+    _attr_humidity: float | None = None
+    _attr_ozone: float | None = None
+    _attr_precision: float
+    _attr_pressure: float | None = None
+    _attr_temperature: float | None
+    _attr_temperature_unit: str
+    _attr_visibility: float | None = None
+    _attr_wind_bearing: float | str | None = None
+    _attr_wind_speed: float | None = None
+
+    # Last forecast conversion: (unit/precision key, source snapshot, result)
+    _forecast_cache: tuple[
+        tuple[str, float, str], list[Forecast], list[Forecast]
+    ] | None = None
+
     @property
-    def temperature(self):
+    def temperature(self) -> float | None:
         """Return the platform temperature."""
-        raise NotImplementedError()
+        return self._attr_temperature
 
     @property
-    def temperature_unit(self):
+    def temperature_unit(self) -> str:
         """Return the unit of measurement."""
-        raise NotImplementedError()
+        return self._attr_temperature_unit
 
     @property
-    def pressure(self):
+    def pressure(self) -> float | None:
         """Return the pressure."""
-        return None
+        return self._attr_pressure
 
     @property
-    def humidity(self):
+    def humidity(self) -> float | None:
         """Return the humidity."""
-        raise NotImplementedError()
+        return self._attr_humidity
 
     @property
-    def wind_speed(self):
+    def wind_speed(self) -> float | None:
         """Return the wind speed."""
-        return None
+        return self._attr_wind_speed
 
     @property
-    def wind_bearing(self):
+    def wind_bearing(self) -> float | str | None:
         """Return the wind bearing."""
-        return None
+        return self._attr_wind_bearing
 
     @property
-    def ozone(self):
+    def ozone(self) -> float | None:
         """Return the ozone level."""
-        return None
+        return self._attr_ozone
 
     @property
-    def attribution(self):
+    def attribution(self) -> str | None:
         """Return the attribution."""
-        return None
+        return self._attr_attribution
 
     @property
-    def visibility(self):
+    def visibility(self) -> float | None:
         """Return the visibility."""
-        return None
+        return self._attr_visibility
 
     @property
-    def forecast(self):
+    def forecast(self) -> list[Forecast] | None:
         """Return the forecast."""
-        return None
+        return self._attr_forecast
 
     @property
-    def precision(self):
+    def precision(self) -> float:
         """Return the precision of the temperature value."""
+        if hasattr(self, "_attr_precision"):
+            return self._attr_precision
         return (
             PRECISION_TENTHS
             if self.temperature_unit == TEMP_CELSIUS
@@ -144,68 +182,80 @@ class WeatherEntity(Entity):
     def state_attributes(self):
         """Return the state attributes."""
         data = {}
-        if self.temperature is not None:
+        hass = self.hass
+        temperature_unit = self.temperature_unit
+        precision = self.precision
+
+        if (temperature := self.temperature) is not None:
             data[ATTR_WEATHER_TEMPERATURE] = show_temp(
-                self.hass, self.temperature, self.temperature_unit, self.precision
+                hass, temperature, temperature_unit, precision
             )
 
-        humidity = self.humidity
-        if humidity is not None:
+        if (humidity := self.humidity) is not None:
             data[ATTR_WEATHER_HUMIDITY] = round(humidity)
 
-        ozone = self.ozone
-        if ozone is not None:
+        if (ozone := self.ozone) is not None:
             data[ATTR_WEATHER_OZONE] = ozone
 
-        pressure = self.pressure
-        if pressure is not None:
+        if (pressure := self.pressure) is not None:
             data[ATTR_WEATHER_PRESSURE] = pressure
 
-        wind_bearing = self.wind_bearing
-        if wind_bearing is not None:
+        if (wind_bearing := self.wind_bearing) is not None:
             data[ATTR_WEATHER_WIND_BEARING] = wind_bearing
 
-        wind_speed = self.wind_speed
-        if wind_speed is not None:
+        if (wind_speed := self.wind_speed) is not None:
             data[ATTR_WEATHER_WIND_SPEED] = wind_speed
 
-        visibility = self.visibility
-        if visibility is not None:
+        if (visibility := self.visibility) is not None:
             data[ATTR_WEATHER_VISIBILITY] = visibility
 
-        attribution = self.attribution
-        if attribution is not None:
+        if (attribution := self.attribution) is not None:
             data[ATTR_WEATHER_ATTRIBUTION] = attribution
 
-        if self.forecast is not None:
-            forecast = []
-            for forecast_entry in self.forecast:
-                forecast_entry = dict(forecast_entry)
-                forecast_entry[ATTR_FORECAST_TEMP] = show_temp(
-                    self.hass,
-                    forecast_entry[ATTR_FORECAST_TEMP],
-                    self.temperature_unit,
-                    self.precision,
+        if (forecast_entries := self.forecast) is not None:
+            cache_key = (
+                temperature_unit,
+                precision,
+                hass.config.units.temperature_unit,
+            )
+            cache = self._forecast_cache
+            # The snapshot is compared by value, so entries that were updated
+            # in place by the integration are converted again.
+            if (
+                cache is not None
+                and cache[0] == cache_key
+                and cache[1] == forecast_entries
+            ):
+                forecast = cache[2]
+            else:
+                forecast = []
+                for forecast_entry in forecast_entries:
+                    # Always build a new dict: integrations may update their
+                    # forecast entries in place and the old state must not change.
+                    forecast_entry = dict(forecast_entry)
+                    for key in FORECAST_TEMPERATURE_ATTRS:
+                        if key in forecast_entry:
+                            forecast_entry[key] = show_temp(
+                                hass, forecast_entry[key], temperature_unit, precision
+                            )
+                    forecast.append(forecast_entry)
+                self._forecast_cache = (
+                    cache_key,
+                    [dict(forecast_entry) for forecast_entry in forecast_entries],
+                    forecast,
                 )
-                if ATTR_FORECAST_TEMP_LOW in forecast_entry:
-                    forecast_entry[ATTR_FORECAST_TEMP_LOW] = show_temp(
-                        self.hass,
-                        forecast_entry[ATTR_FORECAST_TEMP_LOW],
-                        self.temperature_unit,
-                        self.precision,
-                    )
-                forecast.append(forecast_entry)
 
             data[ATTR_FORECAST] = forecast
 
         return data
 
+    @final
     @property
-    def state(self):
+    def state(self) -> str | None:
         """Return the current state."""
         return self.condition
 
     @property
-    def condition(self):
+    def condition(self) -> str | None:
         """Return the current condition."""
-        raise NotImplementedError()
+        return self._attr_condition
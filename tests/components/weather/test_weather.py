@@ -15,8 +15,9 @@ from homeassistant.components.weather import (
     ATTR_WEATHER_WIND_BEARING,
     ATTR_WEATHER_WIND_SPEED,
 )
+from homeassistant.const import PRECISION_TENTHS, TEMP_CELSIUS
 from homeassistant.setup import async_setup_component
-from homeassistant.util.unit_system import METRIC_SYSTEM
+from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 
 
 async def test_attributes(hass):
@@ -70,3 +71,50 @@ async def test_temperature_convert(hass):
 
     data = state.attributes
     assert data.get(ATTR_WEATHER_TEMPERATURE) == -24
+
+
+async def test_attr_shorthand(hass):
+    """Test weather entities can be described with _attr_ attributes."""
+
+    class TestWeather(weather.WeatherEntity):
+        _attr_condition = "sunny"
+        _attr_humidity = 54.4
+        _attr_temperature = 18.46
+        _attr_temperature_unit = TEMP_CELSIUS
+        _attr_forecast = [{ATTR_FORECAST_TEMP: 20.04, ATTR_FORECAST_TEMP_LOW: 9.96}]
+
+    entity = TestWeather()
+    entity.hass = hass
+
+    assert entity.state == "sunny"
+    assert entity.precision == PRECISION_TENTHS
+    data = entity.state_attributes
+    assert data[ATTR_WEATHER_TEMPERATURE] == 18.5
+    assert data[ATTR_WEATHER_HUMIDITY] == 54
+    assert data[ATTR_FORECAST] == [
+        {ATTR_FORECAST_TEMP: 20.0, ATTR_FORECAST_TEMP_LOW: 10.0}
+    ]
+    assert ATTR_WEATHER_PRESSURE not in data
+
+
+async def test_forecast_conversion_cached(hass):
+    """Test the converted forecast is reused until the forecast changes."""
+
+    class TestWeather(weather.WeatherEntity):
+        _attr_condition = "sunny"
+        _attr_temperature = 18.46
+        _attr_temperature_unit = TEMP_CELSIUS
+        _attr_forecast = [{ATTR_FORECAST_TEMP: 20.04}]
+
+    entity = TestWeather()
+    entity.hass = hass
+
+    forecast = entity.state_attributes[ATTR_FORECAST]
+    assert forecast == [{ATTR_FORECAST_TEMP: 20.0}]
+    assert entity.state_attributes[ATTR_FORECAST] is forecast
+
+    entity._attr_forecast[0][ATTR_FORECAST_TEMP] = 21.96
+    assert entity.state_attributes[ATTR_FORECAST] == [{ATTR_FORECAST_TEMP: 22.0}]
+
+    hass.config.units = IMPERIAL_SYSTEM
+    assert entity.state_attributes[ATTR_FORECAST] == [{ATTR_FORECAST_TEMP: 71.5}]
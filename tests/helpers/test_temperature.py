@@ -35,3 +35,8 @@ def test_celsius_tenths(hass):
 def test_fahrenheit_wholes(hass):
     """Test temperature to fahrenheit rounding to wholes."""
     assert display_temp(hass, TEMP, TEMP_FAHRENHEIT, PRECISION_WHOLE) == -4
+
+
+def test_temperature_none(hass):
+    """Test that a missing temperature is passed through."""
+    assert display_temp(hass, None, TEMP_CELSIUS, PRECISION_TENTHS) is None